@@ -65,7 +65,9 @@ extras["testing"] = (
         "pytest-env",
         "pytest-xdist",
         "pytest-vcr",  # to mock Inference
-        "pytest-asyncio",  # for AsyncInferenceClient
+        # for AsyncInferenceClient. `event_loop_policy` fixture is supported from 0.23 and deprecated in 1.4
+        "pytest-asyncio>=0.23,<1.4",
+        "uvloop; sys_platform!='win32'",  # faster event loop for AsyncInferenceClient tests
         "pytest-rerunfailures",  # to rerun flaky tests in CI
         "urllib3<2.0",  # VCR.py broken with urllib3 2.0 (see https://urllib3.readthedocs.io/en/stable/v2-migration-guide.html)
         "soundfile",
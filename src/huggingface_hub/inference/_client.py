@@ -838,7 +838,7 @@ class InferenceClient:
         for framework in frameworks:
             response = get_session().get(f"{INFERENCE_ENDPOINT}/framework/{framework}", headers=self.headers)
             hf_raise_for_status(response)
-            _unpack_response(framework, response.json())
+            _unpack_response(framework, _bytes_to_list(response.content))
 
         # Sort alphabetically for discoverability and return
         for task, models in models_by_task.items():
@@ -2039,7 +2039,7 @@ class InferenceClient:
 
         response = get_session().get(url, headers=self.headers)
         hf_raise_for_status(response)
-        response_data = response.json()
+        response_data = _bytes_to_dict(response.content)
 
         if "error" in response_data:
             raise ValueError(response_data["error"])
@@ -95,6 +95,7 @@ from .._common import _async_yield_from, _import_aiohttp
 
 if TYPE_CHECKING:
     import numpy as np
+    from aiohttp import BaseConnector
     from PIL import Image
 
 logger = logging.getLogger(__name__)
@@ -123,6 +124,10 @@ class AsyncInferenceClient:
             Values in this dictionary will override the default values.
         cookies (`Dict[str, str]`, `optional`):
             Additional cookies to send to the server.
+        connector (`aiohttp.BaseConnector`, `optional`):
+            Connector used by the underlying `aiohttp.ClientSession`. Pass a connector to share a pool of (keep-alive)
+            connections between requests and clients. The connector is not closed by the client. Defaults to None,
+            meaning a new connector is created for each request.
     """
 
     def __init__(
@@ -132,6 +137,7 @@ class AsyncInferenceClient:
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, str]] = None,
         cookies: Optional[Dict[str, str]] = None,
+        connector: Optional["BaseConnector"] = None,
     ) -> None:
         self.model: Optional[str] = model
         self.headers = CaseInsensitiveDict(build_hf_headers(token=token))  # contains 'authorization' + 'user-agent'
@@ -139,6 +145,7 @@ class AsyncInferenceClient:
             self.headers.update(headers)
         self.cookies = cookies
         self.timeout = timeout
+        self.connector = connector
 
     def __repr__(self):
         return f"<InferenceClient(model='{self.model if self.model else ''}', timeout={self.timeout})>"
@@ -226,7 +233,11 @@ class AsyncInferenceClient:
                 # Do not use context manager as we don't want to close the connection immediately when returning
                 # a stream
                 client = aiohttp.ClientSession(
-                    headers=headers, cookies=self.cookies, timeout=aiohttp.ClientTimeout(self.timeout)
+                    headers=headers,
+                    cookies=self.cookies,
+                    timeout=aiohttp.ClientTimeout(self.timeout),
+                    connector=self.connector,
+                    connector_owner=self.connector is None,  # do not close a user-provided connector
                 )
 
                 try:
@@ -844,10 +855,12 @@ class AsyncInferenceClient:
                     models_by_task.setdefault(model["task"], []).append(model["model_id"])
 
         async def _fetch_framework(framework: str) -> None:
-            async with _import_aiohttp().ClientSession(headers=self.headers) as client:
+            async with _import_aiohttp().ClientSession(
+                headers=self.headers, connector=self.connector, connector_owner=self.connector is None
+            ) as client:
                 response = await client.get(f"{INFERENCE_ENDPOINT}/framework/{framework}")
                 response.raise_for_status()
-                _unpack_response(framework, await response.json())
+                _unpack_response(framework, _bytes_to_list(await response.read()))
 
         import asyncio
 
@@ -2070,10 +2083,12 @@ class AsyncInferenceClient:
             raise NotImplementedError("Model status is only available for Inference API endpoints.")
         url = f"{INFERENCE_ENDPOINT}/status/{model}"
 
-        async with _import_aiohttp().ClientSession(headers=self.headers) as client:
+        async with _import_aiohttp().ClientSession(
+            headers=self.headers, connector=self.connector, connector_owner=self.connector is None
+        ) as client:
             response = await client.get(url)
             response.raise_for_status()
-            response_data = await response.json()
+            response_data = _bytes_to_dict(await response.read())
 
         if "error" in response_data:
             raise ValueError(response_data["error"])
@@ -61,6 +61,7 @@ from ._runtime import (
     get_hf_transfer_version,
     get_jinja_version,
     get_numpy_version,
+    get_orjson_version,
     get_pillow_version,
     get_pydantic_version,
     get_pydot_version,
@@ -78,6 +79,7 @@ from ._runtime import (
     is_jinja_available,
     is_notebook,
     is_numpy_available,
+    is_orjson_available,
     is_package_available,
     is_pillow_available,
     is_pydantic_available,
@@ -36,6 +36,7 @@ _CANDIDATES = {
     "hf_transfer": {"hf_transfer"},
     "jinja": {"Jinja2"},
     "numpy": {"numpy"},
+    "orjson": {"orjson"},
     "pillow": {"Pillow"},
     "pydantic": {"pydantic"},
     "pydot": {"pydot"},
@@ -148,6 +149,15 @@ def get_numpy_version() -> str:
     return _get_version("numpy")
 
 
+# orjson
+def is_orjson_available() -> bool:
+    return is_package_available("orjson")
+
+
+def get_orjson_version() -> str:
+    return _get_version("orjson")
+
+
 # Jinja
 def is_jinja_available() -> bool:
     return is_package_available("jinja")
@@ -328,6 +338,7 @@ def dump_environment_info() -> Dict[str, Any]:
     info["gradio"] = get_gradio_version()
     info["tensorboard"] = get_tensorboard_version()
     info["numpy"] = get_numpy_version()
+    info["orjson"] = get_orjson_version()
     info["pydantic"] = get_pydantic_version()
     info["aiohttp"] = get_aiohttp_version()
 
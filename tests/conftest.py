@@ -1,6 +1,6 @@
 import os
 import shutil
-from typing import Generator
+from typing import Dict, Generator
 
 import pytest
 from _pytest.fixtures import SubRequest
@@ -56,3 +56,12 @@ def disable_symlinks_on_windows_ci(monkeypatch: pytest.MonkeyPatch) -> None:
 @pytest.fixture(autouse=True)
 def disable_experimental_warnings(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(huggingface_hub.constants, "HF_HUB_DISABLE_EXPERIMENTAL_WARNING", True)
+
+
+@pytest.fixture(scope="module")
+def vcr_config() -> Dict:
+    """Configure pytest-vcr for all tests using `@pytest.mark.vcr`.
+
+    Strip the `authorization` header from recorded requests so that tokens are never committed in cassettes.
+    """
+    return {"filter_headers": ["authorization"]}
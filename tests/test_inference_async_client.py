@@ -25,9 +25,14 @@ work as well.
 
 import asyncio
 import inspect
+import math
+import warnings
+from typing import Dict
+from unittest.mock import Mock
 
 import pytest
-from aiohttp import ClientResponseError
+from aiohttp import ClientResponseError, TCPConnector
+from vcr import VCR
 
 import huggingface_hub.inference._common
 from huggingface_hub import AsyncInferenceClient, InferenceClient, InferenceTimeoutError
@@ -36,51 +41,82 @@ from huggingface_hub.inference._text_generation import FinishReason, InputToken
 from huggingface_hub.inference._text_generation import ValidationError as TextGenerationValidationError
 
 
+try:
+    import uvloop
+except ImportError:  # not installed (not available on Windows)
+    uvloop = None
+
+if uvloop is not None:
+    # Otherwise, pytest-asyncio's default `event_loop_policy` fixture is used
+    @pytest.fixture(scope="session")
+    def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+        """Run async tests with uvloop (faster event loop)."""
+        return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="module")
+def vcr_config(vcr_config: Dict) -> Dict:
+    # Cassettes of this module are stored as JSON (faster to load than YAML). Safe since they contain no binary data.
+    return {**vcr_config, "serializer": "json", "path_transformer": VCR.ensure_suffix(".json")}
+
+
 @pytest.fixture(autouse=True)
 def patch_non_tgi_server(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(huggingface_hub.inference._common, "_NON_TGI_SERVERS", set())
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tgi_client() -> AsyncInferenceClient:
     return AsyncInferenceClient(model="google/flan-t5-xxl")
 
 
-@pytest.mark.vcr
-@pytest.mark.asyncio
-async def test_async_generate_no_details(tgi_client: AsyncInferenceClient) -> None:
-    response = await tgi_client.text_generation("test", details=False, max_new_tokens=1)
-    assert response == ""
-
-
-@pytest.mark.vcr
-@pytest.mark.asyncio
-async def test_async_generate_with_details(tgi_client: AsyncInferenceClient) -> None:
-    response = await tgi_client.text_generation("test", details=True, max_new_tokens=1, decoder_input_details=True)
-
-    assert response.generated_text == ""
-    assert response.details.finish_reason == FinishReason.Length
-    assert response.details.generated_tokens == 1
-    assert response.details.seed is None
-    assert len(response.details.prefill) == 1
-    assert response.details.prefill[0] == InputToken(id=0, text="<pad>", logprob=None)
-    assert len(response.details.tokens) == 1
-    assert response.details.tokens[0].id == 3
-    assert response.details.tokens[0].text == " "
-    assert not response.details.tokens[0].special
+@pytest.fixture(scope="module")
+def shared_async_client() -> AsyncInferenceClient:
+    # Client is stateless between calls => safe to share it across tests
+    return AsyncInferenceClient()
 
 
 @pytest.mark.vcr
 @pytest.mark.asyncio
-async def test_async_generate_best_of(tgi_client: AsyncInferenceClient) -> None:
-    response = await tgi_client.text_generation(
-        "test", max_new_tokens=1, best_of=2, do_sample=True, decoder_input_details=True, details=True
-    )
-
-    assert response.details.seed is not None
-    assert response.details.best_of_sequences is not None
-    assert len(response.details.best_of_sequences) == 1
-    assert response.details.best_of_sequences[0].seed is not None
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"details": False}, id="no_details"),
+        pytest.param({"details": True, "decoder_input_details": True}, id="with_details"),
+        pytest.param({"best_of": 2, "do_sample": True, "decoder_input_details": True, "details": True}, id="best_of"),
+        pytest.param({"stream": True}, id="stream_no_details"),
+        pytest.param({"stream": True, "details": True}, id="stream_with_details"),
+    ],
+)
+async def test_async_generate(tgi_client: AsyncInferenceClient, kwargs: Dict) -> None:
+    response = await tgi_client.text_generation("test", max_new_tokens=1, **kwargs)
+    if kwargs.get("stream"):
+        responses = [item async for item in response]
+        assert len(responses) == 1
+        response = responses[0]
+
+    if not kwargs.get("details"):
+        # Only the generated text is returned (or the single generated token if streaming)
+        assert isinstance(response, str)
+        assert response == (" " if kwargs.get("stream") else "")
+    elif kwargs.get("best_of"):
+        assert response.details.seed is not None
+        assert response.details.best_of_sequences is not None
+        assert len(response.details.best_of_sequences) == 1
+        assert response.details.best_of_sequences[0].seed is not None
+    else:
+        assert response.generated_text == ""
+        assert response.details.finish_reason == FinishReason.Length
+        assert response.details.generated_tokens == 1
+        assert response.details.seed is None
+
+    if kwargs.get("decoder_input_details") and not kwargs.get("best_of"):
+        assert len(response.details.prefill) == 1
+        assert response.details.prefill[0] == InputToken(id=0, text="<pad>", logprob=None)
+        assert len(response.details.tokens) == 1
+        assert response.details.tokens[0].id == 3
+        assert response.details.tokens[0].text == " "
+        assert not response.details.tokens[0].special
 
 
 @pytest.mark.vcr
@@ -93,60 +129,38 @@ async def test_async_generate_validation_error(tgi_client: AsyncInferenceClient)
 @pytest.mark.vcr
 @pytest.mark.asyncio
 async def test_async_generate_non_tgi_endpoint(tgi_client: AsyncInferenceClient) -> None:
+    # First call is awaited alone: it detects that "gpt2" is not served via TGI and caches this information
     text = await tgi_client.text_generation("0 1 2", model="gpt2", max_new_tokens=10)
     assert text == " 3 4 5 6 7 8 9 10 11 12"
     assert not _is_tgi_server("gpt2")
 
-    # Watermark is ignored (+ warning)
-    with pytest.warns(UserWarning):
-        await tgi_client.text_generation("4 5 6", model="gpt2", max_new_tokens=10, watermark=True)
-
-    # Return as detail even if details=True (+ warning)
-    with pytest.warns(UserWarning):
-        text = await tgi_client.text_generation("0 1 2", model="gpt2", max_new_tokens=10, details=True)
+    async def _err_stream() -> None:
+        # Return as stream raises error
+        with pytest.raises(ValueError):
+            await tgi_client.text_generation("0 1 2", model="gpt2", max_new_tokens=10, stream=True)
+
+    # Remaining calls are independent => run them concurrently. Warnings are captured in a single context: separate
+    # `pytest.warns` contexts would be entered/exited in arbitrary order by the concurrent tasks.
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        _, text, _ = await asyncio.gather(
+            # Watermark is ignored (+ warning)
+            tgi_client.text_generation("4 5 6", model="gpt2", max_new_tokens=10, watermark=True),
+            # Return as detail even if details=True (+ warning)
+            tgi_client.text_generation("0 1 2", model="gpt2", max_new_tokens=10, details=True),
+            _err_stream(),
+        )
     assert isinstance(text, str)
 
-    # Return as stream raises error
-    with pytest.raises(ValueError):
-        await tgi_client.text_generation("0 1 2", model="gpt2", max_new_tokens=10, stream=True)
+    # One warning per call for ignored parameters (watermark, etc.) + one for `details=True`
+    assert sum(issubclass(w.category, UserWarning) for w in record) == 4
+    assert any("Parameter `details=True` will be ignored" in str(w.message) for w in record)
 
 
 @pytest.mark.vcr
 @pytest.mark.asyncio
-async def test_async_generate_stream_no_details(tgi_client: AsyncInferenceClient) -> None:
-    responses = [
-        response async for response in await tgi_client.text_generation("test", max_new_tokens=1, stream=True)
-    ]
-
-    assert len(responses) == 1
-    response = responses[0]
-
-    assert isinstance(response, str)
-    assert response == " "
-
-
-@pytest.mark.vcr
-@pytest.mark.asyncio
-async def test_async_generate_stream_with_details(tgi_client: AsyncInferenceClient) -> None:
-    responses = [
-        response
-        async for response in await tgi_client.text_generation("test", max_new_tokens=1, stream=True, details=True)
-    ]
-
-    assert len(responses) == 1
-    response = responses[0]
-
-    assert response.generated_text == ""
-    assert response.details.finish_reason == FinishReason.Length
-    assert response.details.generated_tokens == 1
-    assert response.details.seed is None
-
-
-@pytest.mark.vcr
-@pytest.mark.asyncio
-async def test_async_sentence_similarity() -> None:
-    async_client = AsyncInferenceClient()
-    scores = await async_client.sentence_similarity(
+async def test_async_sentence_similarity(shared_async_client: AsyncInferenceClient) -> None:
+    scores = await shared_async_client.sentence_similarity(
         "Machine learning is so easy.",
         other_sentences=[
             "Deep learning is so straightforward.",
@@ -154,7 +168,9 @@ async def test_async_sentence_similarity() -> None:
             "I can't believe how much I struggled with this.",
         ],
     )
-    assert scores == [0.7785726189613342, 0.4587625563144684, 0.2906219959259033]
+    expected_scores = [0.7785726189613342, 0.4587625563144684, 0.2906219959259033]
+    assert len(scores) == len(expected_scores)
+    assert all(math.isclose(score, expected, rel_tol=1e-6) for score, expected in zip(scores, expected_scores))
 
 
 def test_sync_vs_async_signatures() -> None:
@@ -177,71 +193,74 @@ def test_sync_vs_async_signatures() -> None:
     assert sync_sig.parameters == async_sig.parameters
     assert sync_sig.return_annotation != async_sig.return_annotation
 
-    [name for name in dir(client) if (not name.startswith("_")) and inspect.ismethod(getattr(client, name))]
+    # Collect public methods once
+    sync_methods = {
+        name: method
+        for name in dir(client)
+        if not name.startswith("_") and inspect.ismethod(method := getattr(client, name))
+    }
+    async_methods = {name: getattr(async_client, name) for name in sync_methods}
 
     # Check that all methods are consistent between InferenceClient and AsyncInferenceClient
-    for name in dir(client):
-        if not inspect.ismethod(getattr(client, name)):  # not a method
-            continue
-        if name.startswith("_"):  # not public method
-            continue
+    for name, sync_method in sync_methods.items():
         if name in special_methods:  # tested separately
             continue
 
         # Check that the sync method is not async
-        sync_method = getattr(client, name)
         assert not inspect.iscoroutinefunction(sync_method)
 
         # Check that the async method is async
-        async_method = getattr(async_client, name)
+        async_method = async_methods[name]
         assert inspect.iscoroutinefunction(async_method)
 
         # Check that expected inputs and outputs are the same
         sync_sig = inspect.signature(sync_method)
         async_sig = inspect.signature(async_method)
+        assert sync_sig.parameters.keys() == async_sig.parameters.keys()  # cheap check first (clearer error)
         assert sync_sig.parameters == async_sig.parameters
         assert sync_sig.return_annotation == async_sig.return_annotation
 
 
 @pytest.mark.asyncio
-async def test_get_status_too_big_model() -> None:
-    model_status = await AsyncInferenceClient().get_model_status("facebook/nllb-moe-54b")
-    assert model_status.loaded is False
-    assert model_status.state == "TooBig"
-    assert model_status.compute_type == "cpu"
-    assert model_status.framework == "transformers"
+async def test_get_status_too_big_and_loaded_models(shared_async_client: AsyncInferenceClient) -> None:
+    # Independent calls => run them concurrently
+    too_big_status, loaded_status = await asyncio.gather(
+        shared_async_client.get_model_status("facebook/nllb-moe-54b"),
+        shared_async_client.get_model_status("bigscience/bloom"),
+    )
 
+    assert too_big_status.loaded is False
+    assert too_big_status.state == "TooBig"
+    assert too_big_status.compute_type == "cpu"
+    assert too_big_status.framework == "transformers"
 
-@pytest.mark.asyncio
-async def test_get_status_loaded_model() -> None:
-    model_status = await AsyncInferenceClient().get_model_status("bigscience/bloom")
-    assert model_status.loaded is True
-    assert model_status.state == "Loaded"
-    assert isinstance(model_status.compute_type, dict)  # e.g. {'gpu': {'gpu': 'a100', 'count': 8}}
-    assert model_status.framework == "text-generation-inference"
+    assert loaded_status.loaded is True
+    assert loaded_status.state == "Loaded"
+    assert isinstance(loaded_status.compute_type, dict)  # e.g. {'gpu': {'gpu': 'a100', 'count': 8}}
+    assert loaded_status.framework == "text-generation-inference"
 
 
 @pytest.mark.asyncio
-async def test_get_status_unknown_model() -> None:
+async def test_get_status_unknown_model(shared_async_client: AsyncInferenceClient) -> None:
     with pytest.raises(ClientResponseError):
-        await AsyncInferenceClient().get_model_status("unknown/model")
+        await shared_async_client.get_model_status("unknown/model")
 
 
 @pytest.mark.asyncio
-async def test_get_status_model_as_url() -> None:
+async def test_get_status_model_as_url(shared_async_client: AsyncInferenceClient) -> None:
     with pytest.raises(NotImplementedError):
-        await AsyncInferenceClient().get_model_status("https://unkown/model")
+        await shared_async_client.get_model_status("https://unkown/model")
 
 
 @pytest.mark.asyncio
-async def test_list_deployed_models_single_frameworks() -> None:
-    models_by_task = await AsyncInferenceClient().list_deployed_models("text-generation-inference")
+async def test_list_deployed_models_single_frameworks(shared_async_client: AsyncInferenceClient) -> None:
+    models_by_task = await shared_async_client.list_deployed_models("text-generation-inference")
     assert isinstance(models_by_task, dict)
-    for task, models in models_by_task.items():
-        assert isinstance(task, str)
-        assert isinstance(models, list)
-        for model in models:
-            assert isinstance(model, str)
+    # Single pass over all tasks and models
+    assert all(
+        isinstance(task, str) and isinstance(models, list) and all(isinstance(model, str) for model in models)
+        for task, models in models_by_task.items()
+    )
 
     assert "text-generation" in models_by_task
     assert "bigscience/bloom" in models_by_task["text-generation"]
@@ -249,17 +268,36 @@ async def test_list_deployed_models_single_frameworks() -> None:
 
 @pytest.mark.asyncio
 async def test_async_generate_timeout_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _mock_aiohttp_client_timeout(*args, **kwargs):
-        raise asyncio.TimeoutError
+    timeout_error = asyncio.TimeoutError()
+    mock_aiohttp_client_timeout = Mock(side_effect=timeout_error)
+
+    monkeypatch.setattr("aiohttp.ClientSession.post", mock_aiohttp_client_timeout)
+    with pytest.raises(InferenceTimeoutError) as error:
+        await AsyncInferenceClient(model="google/flan-t5-xxl", timeout=1).text_generation("test")
+
+    # Raised on first timeout (no retry) and chained to the original error
+    mock_aiohttp_client_timeout.assert_called_once()
+    assert error.value.__cause__ is timeout_error
+
+
+@pytest.mark.asyncio
+async def test_async_client_with_shared_connector(monkeypatch: pytest.MonkeyPatch) -> None:
+    connector = TCPConnector()
+    monkeypatch.setattr("aiohttp.ClientSession.post", Mock(side_effect=asyncio.TimeoutError()))
+
+    client = AsyncInferenceClient(model="google/flan-t5-xxl", connector=connector)
+    for _ in range(2):
+        with pytest.raises(InferenceTimeoutError):
+            await client.text_generation("test")
 
-    monkeypatch.setattr("aiohttp.ClientSession.post", _mock_aiohttp_client_timeout)
-    with pytest.raises(InferenceTimeoutError):
-        await AsyncInferenceClient(timeout=1).text_generation("test")
+    # Sessions are closed after each call but the user-provided connector is kept open for reuse
+    assert not connector.closed
+    await connector.close()
 
 
 @pytest.mark.vcr
 @pytest.mark.asyncio
-async def test_unprocessable_entity_error() -> None:
+async def test_unprocessable_entity_error(shared_async_client: AsyncInferenceClient) -> None:
     with pytest.raises(ClientResponseError) as error:
-        await AsyncInferenceClient().conversational("Hi, who are you?", model="HuggingFaceH4/zephyr-7b-alpha")
+        await shared_async_client.conversational("Hi, who are you?", model="HuggingFaceH4/zephyr-7b-alpha")
     assert "Make sure 'conversational' task is supported by the model." in error.value.message
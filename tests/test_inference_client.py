@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import io
+import json
+import math
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -39,6 +41,12 @@ from huggingface_hub import (
 )
 from huggingface_hub.constants import ALL_INFERENCE_API_FRAMEWORKS, MAIN_INFERENCE_API_FRAMEWORKS
 from huggingface_hub.inference._client import _open_as_binary
+from huggingface_hub.inference._common import (
+    _bytes_to_dict,
+    _bytes_to_list,
+    _format_text_generation_stream_output,
+    _json_loads,
+)
 from huggingface_hub.utils import HfHubHTTPError, build_hf_headers
 
 from .testing_utils import with_production_testing
@@ -93,8 +101,8 @@ class InferenceClientVCRTest(InferenceClientTest):
     - Most of the time, we only test that the return values are correct. We don't always test the actual output of the model.
     - In the CI, VRC replay is always on. If you want to test locally against the server, you can use the `--vcr-mode`
       and `--disable-vcr` command line options. See https://pytest-vcr.readthedocs.io/en/latest/configuration/.
-    - If you get rate-limited locally, you can use your own token when initializing InferenceClient.
-      /!\\ WARNING: if you do so, you must delete the token from the cassette before committing!
+    - If you get rate-limited locally, you can use your own token when initializing InferenceClient. The
+      `authorization` header is filtered out from the cassette when recording (see `vcr_config` in `conftest.py`).
     - If the model is not loaded on the server, you will save a lot of HTTP 503 responses in the cassette. We don't
       want those to be committed. Either delete them manually or rerun the test once the model is loaded on the server.
     """
@@ -611,6 +619,7 @@ class TestModelStatus(unittest.TestCase):
 class TestListDeployedModels(unittest.TestCase):
     @patch("huggingface_hub.inference._client.get_session")
     def test_list_deployed_models_main_frameworks_mock(self, get_session_mock: MagicMock) -> None:
+        get_session_mock.return_value.get.return_value.content = b"[]"
         InferenceClient().list_deployed_models()
         self.assertEqual(
             len(get_session_mock.return_value.get.call_args_list),
@@ -619,6 +628,7 @@ class TestListDeployedModels(unittest.TestCase):
 
     @patch("huggingface_hub.inference._client.get_session")
     def test_list_deployed_models_all_frameworks_mock(self, get_session_mock: MagicMock) -> None:
+        get_session_mock.return_value.get.return_value.content = b"[]"
         InferenceClient().list_deployed_models("all")
         self.assertEqual(
             len(get_session_mock.return_value.get.call_args_list),
@@ -636,3 +646,26 @@ class TestListDeployedModels(unittest.TestCase):
 
         self.assertIn("text-generation", models_by_task)
         self.assertIn("bigscience/bloom", models_by_task["text-generation"])
+
+
+class TestJsonDecoding(unittest.TestCase):
+    def test_non_standard_payloads(self) -> None:
+        # Must be decoded the same whether `orjson` is installed or not
+        self.assertTrue(math.isnan(_json_loads(b'{"score": NaN}')["score"]))
+        self.assertEqual(_json_loads(b"[Infinity]"), [float("inf")])
+        self.assertEqual(_json_loads(b"[18446744073709551615]"), [18446744073709551615])  # max uint64 (e.g. seed)
+
+    def test_invalid_payload(self) -> None:
+        with self.assertRaises(ValueError):
+            _json_loads(b"not json")
+
+    @patch("huggingface_hub.inference._common._json_loads", json.loads)
+    def test_decode_with_stdlib_json(self) -> None:
+        # Same helpers but decoded with `json` (as if `orjson` was not installed)
+        self.assertEqual(_bytes_to_dict(b'{"loaded": true}'), {"loaded": True})
+        self.assertEqual(_bytes_to_list(b'[{"score": 0.5}]'), [{"score": 0.5}])
+        output = _format_text_generation_stream_output(
+            b'data:{"token":{"id":3,"text":" ","logprob":-0.1,"special":false},"generated_text":null,"details":null}\n',
+            details=False,
+        )
+        self.assertEqual(output, " ")
@@ -11,7 +11,7 @@ from pydantic import ValidationError
 from requests import HTTPError
 
 from huggingface_hub import InferenceClient
-from huggingface_hub.inference._common import _NON_TGI_SERVERS
+from huggingface_hub.inference._common import _NON_TGI_SERVERS, _format_text_generation_stream_output
 from huggingface_hub.inference._text_generation import (
     FinishReason,
     GenerationError,
@@ -159,6 +159,31 @@ class TestTextGenerationErrors(unittest.TestCase):
             raise_text_generation_error(error)
 
 
+class TestFormatTextGenerationStreamOutput(unittest.TestCase):
+    payload = (
+        b'data:{"token":{"id":3,"text":" ","logprob":-0.1,"special":false},"generated_text":null,"details":null}\n'
+    )
+
+    def test_skip_non_event_lines(self):
+        self.assertIsNone(_format_text_generation_stream_output(b"\n", details=False))
+        self.assertIsNone(_format_text_generation_stream_output(b"", details=False))
+        self.assertIsNone(_format_text_generation_stream_output(b": keep-alive\n", details=False))
+
+    def test_token_text(self):
+        self.assertEqual(_format_text_generation_stream_output(self.payload, details=False), " ")
+
+    def test_token_details(self):
+        output = _format_text_generation_stream_output(self.payload, details=True)
+        self.assertIsInstance(output, TextGenerationStreamResponse)
+        self.assertEqual(output.token.id, 3)
+
+    def test_error_event(self):
+        with self.assertRaises(OverloadedError):
+            _format_text_generation_stream_output(
+                b'data:{"error":"Model is overloaded","error_type":"overloaded"}\n', details=False
+            )
+
+
 def _mocked_error(payload: Dict) -> MagicMock:
     error = HTTPError(response=MagicMock())
     error.response.json.return_value = payload
@@ -41,6 +41,9 @@ def generate_async_client_code(code: str) -> str:
     # Define `AsyncInferenceClient`
     code = _rename_to_AsyncInferenceClient(code)
 
+    # Add `connector` parameter to share a connection pool between aiohttp sessions
+    code = _add_connector_to_init(code)
+
     # Refactor `.post` method to be async + adapt calls
     code = _make_post_async(code)
     code = _await_post_method_call(code)
@@ -155,7 +158,7 @@ def _add_imports(code: str) -> str:
     # type-checking imports
     code = re.sub(
         r"(\nif TYPE_CHECKING:\n)",
-        repl=r"\1    from aiohttp import ClientResponse, ClientSession\n",
+        repl=r"\1    from aiohttp import BaseConnector, ClientResponse, ClientSession\n",
         string=code,
         count=1,
         flags=re.DOTALL,
@@ -168,6 +171,51 @@ def _rename_to_AsyncInferenceClient(code: str) -> str:
     return code.replace("class InferenceClient:", "class AsyncInferenceClient:", 1)
 
 
+def _add_connector_to_init(code: str) -> str:
+    # Document new parameter
+    code = code.replace(
+        """
+        cookies (`Dict[str, str]`, `optional`):
+            Additional cookies to send to the server.
+""",
+        """
+        cookies (`Dict[str, str]`, `optional`):
+            Additional cookies to send to the server.
+        connector (`aiohttp.BaseConnector`, `optional`):
+            Connector used by the underlying `aiohttp.ClientSession`. Pass a connector to share a pool of (keep-alive)
+            connections between requests and clients. The connector is not closed by the client. Defaults to None,
+            meaning a new connector is created for each request.
+""",
+        1,
+    )
+
+    # Add parameter to signature
+    code = code.replace(
+        """
+        cookies: Optional[Dict[str, str]] = None,
+    ) -> None:""",
+        """
+        cookies: Optional[Dict[str, str]] = None,
+        connector: Optional["BaseConnector"] = None,
+    ) -> None:""",
+        1,
+    )
+
+    # Store it
+    return code.replace(
+        """
+        self.cookies = cookies
+        self.timeout = timeout
+""",
+        """
+        self.cookies = cookies
+        self.timeout = timeout
+        self.connector = connector
+""",
+        1,
+    )
+
+
 ASYNC_POST_CODE = """
         aiohttp = _import_aiohttp()
 
@@ -188,7 +236,11 @@ ASYNC_POST_CODE = """
                 # Do not use context manager as we don't want to close the connection immediately when returning
                 # a stream
                 client = aiohttp.ClientSession(
-                    headers=headers, cookies=self.cookies, timeout=aiohttp.ClientTimeout(self.timeout)
+                    headers=headers,
+                    cookies=self.cookies,
+                    timeout=aiohttp.ClientTimeout(self.timeout),
+                    connector=self.connector,
+                    connector_owner=self.connector is None,  # do not close a user-provided connector
                 )
 
                 try:
@@ -361,13 +413,15 @@ def _adapt_get_model_status(code: str) -> str:
     sync_snippet = """
         response = get_session().get(url, headers=self.headers)
         hf_raise_for_status(response)
-        response_data = response.json()"""
+        response_data = _bytes_to_dict(response.content)"""
 
     async_snippet = """
-        async with _import_aiohttp().ClientSession(headers=self.headers) as client:
+        async with _import_aiohttp().ClientSession(
+            headers=self.headers, connector=self.connector, connector_owner=self.connector is None
+        ) as client:
             response = await client.get(url)
             response.raise_for_status()
-            response_data = await response.json()"""
+            response_data = _bytes_to_dict(await response.read())"""
 
     return code.replace(sync_snippet, async_snippet)
 
@@ -377,14 +431,16 @@ def _adapt_list_deployed_models(code: str) -> str:
         for framework in frameworks:
             response = get_session().get(f"{INFERENCE_ENDPOINT}/framework/{framework}", headers=self.headers)
             hf_raise_for_status(response)
-            _unpack_response(framework, response.json())""".strip()
+            _unpack_response(framework, _bytes_to_list(response.content))""".strip()
 
     async_snippet = """
         async def _fetch_framework(framework: str) -> None:
-            async with _import_aiohttp().ClientSession(headers=self.headers) as client:
+            async with _import_aiohttp().ClientSession(
+                headers=self.headers, connector=self.connector, connector_owner=self.connector is None
+            ) as client:
                 response = await client.get(f"{INFERENCE_ENDPOINT}/framework/{framework}")
                 response.raise_for_status()
-                _unpack_response(framework, await response.json())
+                _unpack_response(framework, _bytes_to_list(await response.read()))
 
         import asyncio
 